@@ -0,0 +1,11 @@
+#!/bin/bash
+# Compiles Qt Designer .ui files to Python code, so the XML doesn't need to be parsed at runtime.
+# Run this after editing a .ui file. (pyuic6 comes with PyQt6.)
+
+set -e
+
+cd "$(dirname "$(readlink -f "$0")")/src/quick_move"
+
+pyuic6 main_window.ui -o main_window_ui.py
+pyuic6 about_window.ui -o about_window_ui.py
+pyuic6 recent_move_dialog.ui -o recent_move_dialog_ui.py
@@ -10,12 +10,21 @@ __license__ = "GPLv3"
 
 # Set version string when in a git repository
 # to distinguish production from development versions.
+# This is done lazily (PEP 562), since running git takes a while,
+# and most imports of this package don't need the version.
 
 from os.path import dirname, exists
-from subprocess import check_output
 
 DEVELOPMENT = exists(dirname(__file__) + "/../../.git")
 """Whether running from a Git repository."""
 
 if DEVELOPMENT:
-    __version__ = "development " + check_output(["git", "describe", "--tags"], cwd=dirname(__file__)).strip().decode()
+    del __version__
+
+    def __getattr__(name: str) -> str:
+        if name == "__version__":
+            from subprocess import check_output
+            global __version__
+            __version__ = "development " + check_output(["git", "describe", "--tags"], cwd=dirname(__file__)).strip().decode()
+            return __version__
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
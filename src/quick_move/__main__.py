@@ -2,13 +2,29 @@
 
 import os.path
 import signal
+import stat
 import sys
 
 from PyQt6.QtWidgets import QApplication
 
-from quick_move import __version__
 from quick_move.main_window import MainWindow
-from quick_move.desktop_automation import get_selected_files
+
+
+def _fast_realpath(path: str) -> str:
+    """Like `os.path.realpath`, but skips the per-component symlink resolution when it's not needed.
+
+    `realpath` does an `lstat` for every path component, which adds up at startup with many files.
+    Only the path itself is checked for being a symlink, so symlinked parent directories are left as-is.
+    DOS-style short filenames (e.g. `PROGRA~1`) are still expanded on Windows.
+    """
+    abs_path = os.path.abspath(path)
+    try:
+        st = os.lstat(abs_path)
+    except OSError:
+        return abs_path
+    if stat.S_ISLNK(st.st_mode) or (os.name == 'nt' and '~' in abs_path):
+        return os.path.realpath(abs_path)
+    return abs_path
 
 
 def main():
@@ -24,22 +40,24 @@ def main():
     destination_scope = os.path.expanduser('~/Sync/')
     if not os.path.exists(destination_scope):
         destination_scope = os.path.expanduser('~/')
-    # Normalize to native path separators (/ on Linux, \ on Windows)
-    # and handle DOS-style short filenames and symbolic links.
-    # (not sure if resolving symlinks is necessary / a good idea)
-    destination_scope = os.path.realpath(destination_scope) + os.path.sep
+    # Normalize to native path separators (/ on Linux, \ on Windows).
+    # This is only used as a textual prefix for suggestions, so it's normalized lexically
+    # (abspath normalizes), without touching the file system. This also keeps ~/Sync as ~/Sync if it's a symlink.
+    destination_scope = os.path.abspath(destination_scope) + os.path.sep
 
     # Get payload from command line arguments
     payload = sys.argv[1:] if len(sys.argv) > 1 else []
     # Get selection with desktop automation
     if payload and payload[0] == '--from-clipboard':
+        # Imported here since desktop automation (and pyperclip) isn't needed otherwise, and slows down startup.
+        from quick_move.desktop_automation import get_selected_files
         payload = get_selected_files()
 
     # Handle DOS-style short filenames and symbolic links.
     # (Not sure if resolving symlinks is necessary / a good idea,
     # but handling DOS-style short filenames is important for long paths
-    # on Windows, and realpath() does both.)
-    payload = [os.path.realpath(p) for p in payload]
+    # on Windows, and realpath() does both. It's fairly slow though, so it's only used where needed.)
+    payload = [_fast_realpath(p) for p in payload]
 
     window = MainWindow(payload, destination_scope)
     window.show()
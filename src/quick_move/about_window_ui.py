@@ -0,0 +1,46 @@
+# Form implementation generated from reading ui file 'about_window.ui'
+#
+# Created by: PyQt6 UI code generator 6.9.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(400, 300)
+        self.buttonBox = QtWidgets.QDialogButtonBox(parent=Dialog)
+        self.buttonBox.setGeometry(QtCore.QRect(30, 240, 341, 32))
+        self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.body_label = QtWidgets.QLabel(parent=Dialog)
+        self.body_label.setGeometry(QtCore.QRect(30, 90, 331, 141))
+        self.body_label.setTextFormat(QtCore.Qt.TextFormat.RichText)
+        self.body_label.setOpenExternalLinks(True)
+        self.body_label.setObjectName("body_label")
+        self.heading_label = QtWidgets.QLabel(parent=Dialog)
+        self.heading_label.setGeometry(QtCore.QRect(30, 30, 331, 31))
+        self.heading_label.setTextFormat(QtCore.Qt.TextFormat.MarkdownText)
+        self.heading_label.setOpenExternalLinks(True)
+        self.heading_label.setObjectName("heading_label")
+        self.version_label = QtWidgets.QLabel(parent=Dialog)
+        self.version_label.setGeometry(QtCore.QRect(30, 70, 341, 17))
+        self.version_label.setOpenExternalLinks(True)
+        self.version_label.setObjectName("version_label")
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "About Quick Move"))
+        self.body_label.setText(_translate("Dialog", "<html><head/><body><p>Written by <a href=\"https://isaiahodhner.io\"><span style=\" text-decoration: underline; color:#3584e4;\">Isaiah Odhner</span></a></p><p>Open source <a href=\"https://github.com/1j01/quick-move\"><span style=\" text-decoration: underline; color:#3584e4;\">on GitHub</span></a></p><p>Licensed under GPLv3 (see LICENSE.txt)</p></body></html>"))
+        self.heading_label.setText(_translate("Dialog", "# Quick Move"))
+        self.version_label.setText(_translate("Dialog", "vX.Y.Z"))
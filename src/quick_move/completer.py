@@ -1,6 +1,8 @@
 """Fuzzy file path autocompletion"""
 
+import heapq
 import os
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import NamedTuple, cast
@@ -16,9 +18,10 @@ class SortInfo(NamedTuple):
     start_position: int
     alphabetical: str
 
-@dataclass
+# Slots make these smaller and faster to create, as there may be thousands per keystroke.
+@dataclass(slots=True)
 class Completion:
-    path: Path
+    path_str: str
     display_text: str
     unsorted_match_highlights: list[tuple[int, int]]
     match_highlights: list[tuple[int, int]]
@@ -26,12 +29,107 @@ class Completion:
     ai_suggested: bool
     sort_info: SortInfo | None = None
 
+    @property
+    def path(self) -> Path:
+        """The path as a `Path` object. (Not stored, since `Path` objects are comparatively expensive to create.)"""
+        return Path(self.path_str)
+
 # This prevents the program from hanging when searching large directories, e.g. the root directory.
-# Since os.walk uses breadth-first search by default, it still gives good results, as nearby directories are searched first.
+# Since the directory walk uses breadth-first search, it still gives good results, as nearby directories are searched first.
 # That said, there may be pathological cases where it will not find even fairly shallow matches.
 # I haven't explored this in "depth" (haha) yet.
 MAX_ITERATIONS = 1000
 MAX_COMPLETIONS = 100
+# The search also stops once this many matches have every search crumb matching in full, in order.
+# Such matches sort near the top, and since the search is breadth-first, deeper matches would tend to sort lower anyway.
+ENOUGH_GOOD_COMPLETIONS = 20
+
+# Hidden folders (e.g. .git) and package folders are often huge, and would use up the MAX_ITERATIONS budget,
+# so they're suggested, but not searched inside, unless the search is already inside one.
+UNSEARCHED_DIRECTORY_NAMES = {"node_modules", "__pycache__"}
+
+_normalized_scope_cache: dict[str, str] = {}
+"""Maps folder scopes, as passed to `get_completions`, to their normalized forms.
+
+The folder scope is usually the same for every keystroke, so there's no need to normalize it each time.
+"""
+
+def _normalize_folder_scope(folder_scope: str) -> str:
+    """Expand `~` and make the folder scope absolute, with native path separators."""
+    cached = _normalized_scope_cache.get(folder_scope)
+    if cached is not None:
+        return cached
+    normalized = os.path.expanduser(folder_scope)
+    if not os.path.isabs(normalized):
+        # Relative paths depend on the current working directory, so don't cache them.
+        return os.path.normpath(os.path.join(os.getcwd(), normalized))
+    normalized = os.path.normpath(normalized)
+    _normalized_scope_cache[folder_scope] = normalized
+    return normalized
+
+_listing_cache: dict[str, tuple[int, int, list[tuple[str, bool]]]] = {}
+"""Maps directory paths to their modification time (ns), size, and sorted subdirectories (name, is_symlink).
+
+The same directories are listed again on every keystroke, so listings are reused as long as the directory's mtime is unchanged.
+"""
+
+def _list_subdirectories(path: str) -> list[tuple[str, bool]]:
+    """List the subdirectories of `path`, sorted by name, along with whether each is a symlink.
+
+    Returns an empty list if the directory can't be read.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return []
+    cached = _listing_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    subdirectories: list[tuple[str, bool]] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    # Like os.walk, symlinks to directories are listed, but not descended into.
+                    if entry.is_dir():
+                        subdirectories.append((entry.name, entry.is_symlink()))
+                except OSError:
+                    pass
+    except OSError:
+        return []
+    subdirectories.sort()
+    _listing_cache[path] = (st.st_mtime_ns, st.st_size, subdirectories)
+    return subdirectories
+
+def invalidate_listing_cache(path: str | None = None) -> None:
+    """Forget the cached listing of a directory, or of all directories if `path` is None.
+
+    Listings are already revalidated by modification time, but some file systems have coarse timestamps,
+    so this should be called after moving things in or out of a directory.
+    """
+    if path is None:
+        _listing_cache.clear()
+    else:
+        _listing_cache.pop(os.path.normpath(path), None)
+
+def _walk_directories(top: str):
+    """Walk the directory tree breadth-first, using the listing cache.
+
+    Yields each directory path with a trailing separator (so that subdirectory paths can be made by concatenation),
+    and the names of its subdirectories, in sorted order.
+    Like `os.walk`, symlinks to directories are listed, but not descended into.
+    The same goes for hidden directories and `UNSEARCHED_DIRECTORY_NAMES`.
+    """
+    queue = deque([top])
+    while queue:
+        root = queue.popleft()
+        prefix = root if root.endswith(os.path.sep) else root + os.path.sep
+        subdirectories = _list_subdirectories(root)
+        yield prefix, [name for name, _is_symlink in subdirectories]
+        queue.extend(
+            prefix + name for name, is_symlink in subdirectories
+            if not is_symlink and not name.startswith('.') and name not in UNSEARCHED_DIRECTORY_NAMES
+        )
 
 def get_completions(search: str, folder_scope: str = "/") -> list[Completion]:
     """Get file path completions based on the search input and folder scope."""
@@ -40,10 +138,7 @@ def get_completions(search: str, folder_scope: str = "/") -> list[Completion]:
     search = search.strip()
 
     # Normalize the folder scope
-    folder_scope = os.path.expanduser(folder_scope)
-    if not os.path.isabs(folder_scope):
-        folder_scope = os.path.join(os.getcwd(), folder_scope)
-    folder_scope = os.path.normpath(folder_scope)
+    folder_scope = _normalize_folder_scope(folder_scope)
 
     # Find the deepest existing directory that exactly matches the search path
     search_from = folder_scope
@@ -63,7 +158,8 @@ def get_completions(search: str, folder_scope: str = "/") -> list[Completion]:
     # print(f"Searching from: {search_from} with crumbs: {search_crumbs}")
 
     consumed_path = search_from
-    if not search.startswith(consumed_path):
+    # (This sanity check is skipped when running with `python -O`.)
+    if __debug__ and not search.startswith(consumed_path):
         print(f"Warning: search '{search}' does not start with consumed path '{consumed_path}'. This may lead to unexpected results.")
         print(f"consumed_path: {consumed_path}")
         print(f"folder_scope: {folder_scope}")
@@ -75,35 +171,45 @@ def get_completions(search: str, folder_scope: str = "/") -> list[Completion]:
     # TODO: better fuzzier matching, e.g. using difflib.get_close_matches or similar
     completions: list[Completion] = []
     steps = 0
-    for root, dirs, _files in os.walk(search_from):
+    good_completions = 0
+    # These don't depend on the suggestion, so they're computed once rather than for every directory visited.
+    lowercase_crumbs = [(crumb.lower(), len(crumb)) for crumb in search_crumbs]
+    match_offset = len(consumed_path)
+    for root_prefix, dirs in _walk_directories(search_from):
         steps += 1
-        if steps > MAX_ITERATIONS or len(completions) > MAX_COMPLETIONS:
+        if steps > MAX_ITERATIONS or len(completions) > MAX_COMPLETIONS or good_completions >= ENOUGH_GOOD_COMPLETIONS:
             break
-        # Sorting here is not strictly necessary since matches are sorted later,
+        # The directories are sorted (by _list_subdirectories), which is not strictly necessary since matches are sorted later,
         # but it may help with determinism in case MAX_COMPLETIONS or MAX_ITERATIONS is reached.
-        for name in sorted(dirs):
-            suggestion = os.path.join(root, name)
+        for name in dirs:
+            suggestion = root_prefix + name
 
             match_highlights: list[tuple[int, int]] = []
+            good = bool(search_crumbs)
             if search_crumbs:
-                suggestion_lower = suggestion.lower()
-                for crumb in search_crumbs:
-                    crumb_lower = crumb.lower()
-                    start = suggestion_lower.find(crumb_lower, len(consumed_path))
+                # Matches are only searched for after the consumed path, so only that part needs lowercasing.
+                # Indices in it are offset by match_offset to get indices in the suggestion.
+                tail_lower = suggestion[match_offset:].lower()
+                for crumb_lower, crumb_length in lowercase_crumbs:
+                    start = tail_lower.find(crumb_lower)
                     if start != -1:
-                        match_highlights.append((start, start + len(crumb)))
+                        if match_highlights and match_offset + start < match_highlights[-1][0]:
+                            good = False
+                        match_highlights.append((match_offset + start, match_offset + start + crumb_length))
                     else:
+                        good = False
                         # Look for smaller matches (individual characters), for fuzzy matching
-                        for i in range(len(crumb_lower)):
-                            start = suggestion_lower.find(crumb_lower[i], len(consumed_path))
+                        for char in crumb_lower:
+                            start = tail_lower.find(char)
                             if start != -1:
-                                match_highlights.append((start, start + 1))
+                                match_highlights.append((match_offset + start, match_offset + start + 1))
                                 # break
 
             if match_highlights or not search_crumbs:
+                good_completions += good
                 completions.append(
                     Completion(
-                        path=Path(suggestion),
+                        path_str=suggestion,
                         display_text=suggestion,
                         unsorted_match_highlights=match_highlights,
                         match_highlights=merge_ranges(match_highlights),
@@ -115,22 +221,25 @@ def get_completions(search: str, folder_scope: str = "/") -> list[Completion]:
     # sort completions by relevance, e.g. by length of the match, how many crumbs match (or maybe how many characters would be better), how in order the matches are
     # TODO: prioritize matches that fit word boundaries, e.g. "bar" should match "foo/bar" before "foobar", and "foobar" before "foobarbaz"
     # (and consider lowercase-to-uppercase letter pairs as word boundaries, for camelCase)
+    # (This runs for every match, so it avoids Python-level loops where a string method or zip can do the work.)
+    hidden_part_marker = os.path.sep + '.'
     for c in completions:
         c.sort_info=SortInfo(
-            # deprioritize dotfolders
-            any(part.startswith('.') for part in c.path.parts),
+            # deprioritize dotfolders (any path part starting with a dot)
+            hidden_part_marker in c.path_str or c.path_str.startswith('.'),
             # prioritize longer matches (total matched characters)
             -sum((end - start) ** 2 for start, end in c.match_highlights),
             # prioritize FEWER separate matches, which means larger contiguous matches are prioritized (in conjunction with the previous rule)
             len(c.match_highlights),
             # prioritize ordered match sets (by counting how many pairs are out of order)
-            sum(1 for i in range(len(c.unsorted_match_highlights) - 1) if c.unsorted_match_highlights[i][0] > c.unsorted_match_highlights[i + 1][0]),
+            sum(a[0] > b[0] for a, b in zip(c.unsorted_match_highlights, c.unsorted_match_highlights[1:])),
             # prioritize matches that are closer to the start of the path
             sum(start for start, _ in c.match_highlights),
             # fallback to alphabetical order
             c.display_text
         )
 
-    completions.sort(key=lambda c: cast(SortInfo, c.sort_info))
-
-    return completions[:MAX_COMPLETIONS]
+    # Only the best matches are returned, so there's no need to sort all of them,
+    # which matters when a large directory has many matches.
+    # (nsmallest is equivalent to sorted(...)[:n], including for ties.)
+    return heapq.nsmallest(MAX_COMPLETIONS, completions, key=lambda c: cast(SortInfo, c.sort_info))
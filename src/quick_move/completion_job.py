@@ -0,0 +1,32 @@
+"""Searching for completions on a background thread, so typing stays responsive on slow file systems."""
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from quick_move.completer import get_completions
+
+
+class CompletionJobSignals(QObject):
+    """Signals for `CompletionJob`s. (QRunnable isn't a QObject, so it can't have signals itself.)
+
+    This is shared by all the jobs for a window, and should be parented to the window,
+    so that it outlives any job that's still running when a newer search replaces it.
+    """
+
+    finished = pyqtSignal(object, int)
+    """Emitted with the list of `Completion`s and the job's query number."""
+
+
+class CompletionJob(QRunnable):
+    """Gets completions for a search, for use with a QThreadPool."""
+
+    def __init__(self, search: str, folder_scope: str, query_number: int, signals: CompletionJobSignals):
+        super().__init__()
+        self.search = search
+        self.folder_scope = folder_scope
+        self.query_number = query_number
+        """Identifies the query, so that results of outdated queries can be ignored."""
+        self.signals = signals
+
+    def run(self) -> None:
+        completions = get_completions(self.search, self.folder_scope)
+        self.signals.finished.emit(completions, self.query_number)
@@ -1,11 +1,66 @@
 import os
 import sys
 
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QApplication, QMessageBox
 
 from quick_move.helpers import waitForPaste
 
 
+def _send_ctrl_x_xdotool() -> None:
+    """Press Ctrl+X on X11 with xdotool."""
+    # Use xdotool rather than the keyboard module to avoid needing root permissions
+    import subprocess
+    subprocess.run(['xdotool', 'key', '--delay', '0', '--clearmodifiers', 'ctrl+x'], check=True)
+
+
+def _send_ctrl_x_x11() -> None:
+    """Press Ctrl+X on X11.
+
+    Uses the XTEST extension in-process if python-xlib is installed,
+    which avoids spawning xdotool (which can be slow to start),
+    and falls back to xdotool if it isn't installed, or the display can't be used.
+    """
+    try:
+        from Xlib import X, XK
+        from Xlib import error as xlib_error
+        from Xlib.display import Display
+        from Xlib.ext import xtest
+    except ImportError:
+        _send_ctrl_x_xdotool()
+        return
+
+    try:
+        display = Display()
+    except (xlib_error.DisplayError, xlib_error.ConnectionClosedError, xlib_error.XauthError, OSError):
+        _send_ctrl_x_xdotool()
+        return
+    try:
+        # Like xdotool's --clearmodifiers, release any modifiers still held (e.g. from the shortcut that launched this program),
+        # since otherwise it would be a different key combination, like Ctrl+Shift+X.
+        # (Unlike xdotool, they're not pressed again afterwards, since the user may have let go of them in the meantime,
+        # which would leave them stuck down.)
+        pressed_keys = display.query_keymap()
+        ctrl_keycode = display.keysym_to_keycode(XK.XK_Control_L)
+        x_keycode = display.keysym_to_keycode(XK.XK_x)
+        for modifier_index, modifier_keycodes in enumerate(display.get_modifier_mapping()):
+            if modifier_index == X.LockMapIndex:
+                # Caps Lock is a toggle, not held
+                continue
+            for keycode in modifier_keycodes:
+                if keycode and pressed_keys[keycode // 8] & (1 << (keycode % 8)):
+                    xtest.fake_input(display, X.KeyRelease, keycode)
+        xtest.fake_input(display, X.KeyPress, ctrl_keycode)
+        xtest.fake_input(display, X.KeyPress, x_keycode)
+        xtest.fake_input(display, X.KeyRelease, x_keycode)
+        xtest.fake_input(display, X.KeyRelease, ctrl_keycode)
+        display.sync()
+    except (xlib_error.ConnectionClosedError, OSError):
+        # (If some keys were already sent, Ctrl+X may be pressed twice, but cutting twice is harmless.)
+        _send_ctrl_x_xdotool()
+    finally:
+        display.close()
+
+
 def get_selected_files() -> list[str]:
     """
     Get the currently selected files in the file manager.
@@ -15,9 +70,18 @@ def get_selected_files() -> list[str]:
     TODO: improve this error handling.
     """
     import pyperclip
-    original_clipboard = pyperclip.paste()
+
+    # Qt can read and clear the clipboard in-process, whereas pyperclip spawns xclip/xsel on Linux.
+    # Restoring the clipboard still goes through pyperclip, since on X11, the clipboard contents are served by
+    # the owning process, and xclip stays running to serve them after this program exits.
+    app = QApplication.instance()
+    clipboard = app.clipboard() if isinstance(app, QApplication) else None
+    original_clipboard = clipboard.text() if clipboard is not None else pyperclip.paste()
     # Clear the clipboard in order to wait for it to be populated (even if the same data is copied that was there originally).
-    pyperclip.copy('')
+    if clipboard is not None:
+        clipboard.clear()
+    else:
+        pyperclip.copy('')
 
     if os.name == 'nt':
         import keyboard
@@ -27,9 +91,7 @@ def get_selected_files() -> list[str]:
     else:
         # import keyboard
         # keyboard.send('ctrl+x')
-        # Instead of keyboard, use xdotool to avoid needing root permissions
-        import subprocess
-        subprocess.run(['xdotool', 'key', '--clearmodifiers', 'ctrl+x'], check=True)
+        _send_ctrl_x_x11()
     # This may look like a race condition, where if the clipboard is updated before we start waiting for it to change, it will not be detected.
     # However, waitForPaste does not compare against a snapshot of the clipboard, it waits for a non-empty clipboard.
     # We should get the new clipboard content even if it's already changed before calling waitForPaste.
@@ -59,6 +121,6 @@ def get_selected_files() -> list[str]:
         # However, a path can END with a double quote that is part of the file name.
         # Also, we only want to strip ONE double quote at the start and end of the path, if it's quoted, otherwise we might remove a quote that is part of the file name.
         # payload = [file.strip('"') for file in payload] ; naive
-        payload = [file[1:-1] if file.startswith('"') and file.endswith('"') else file for file in payload]
+        payload = [file[1:-1] if len(file) >= 2 and file[0] == '"' and file[-1] == '"' else file for file in payload]
 
     return payload
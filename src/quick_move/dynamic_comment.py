@@ -2,9 +2,12 @@
 """Adds/updates generated comments in source files at runtime."""
 
 import atexit
-import inspect
+import os
 import re
+import shutil
+import sys
 from collections import defaultdict
+from itertools import groupby
 
 special_comment_delimiter = "#<#"
 """Denotes a generated comment, and is used to replace the comment."""
@@ -15,6 +18,20 @@ replacements: dict[str, list[tuple[range, str]]] = defaultdict(list)
 modified_files: set[str] = set()
 """File paths that have been modified by this module."""
 
+_source_lines_cache: dict[str, tuple[int, list[str]]] = {}
+"""Maps file paths to their modification time (ns) and lines, to avoid re-reading a file for every call in it."""
+
+def _read_source_lines(file: str) -> list[str]:
+    """Read the lines of a source file, reusing the previous read if the file hasn't changed since."""
+    mtime = os.stat(file).st_mtime_ns
+    cached = _source_lines_cache.get(file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(file, 'r') as f:
+        source_lines = f.readlines()
+    _source_lines_cache[file] = (mtime, source_lines)
+    return source_lines
+
 def generate_comment(new_comment_content: str, *, above: bool = True, stack_depth: int = 1, trim: bool = True):
     """
     Insert or replace a comment above (or below) the call site, once the program exits.
@@ -32,17 +49,16 @@ def generate_comment(new_comment_content: str, *, above: bool = True, stack_dept
     """
 
     # Get the caller's frame and source file name
-    current_frame = inspect.currentframe()
-    assert current_frame is not None, "Cannot get current frame"
-    caller_frame = current_frame
-    for i in range(stack_depth):
-        assert caller_frame.f_back is not None, f"Cannot get caller's frame (frame {i} of {stack_depth}: {caller_frame})"
-        caller_frame = caller_frame.f_back
+    # (sys._getframe jumps straight to the frame at the given depth, rather than walking f_back in Python.)
+    try:
+        caller_frame = sys._getframe(stack_depth)  # pyright: ignore[reportPrivateUsage]
+    except ValueError:
+        raise AssertionError(f"Cannot get caller's frame (stack depth {stack_depth} is deeper than the call stack)")
     caller_file = caller_frame.f_globals['__file__']
 
     # Read the entire source file
-    with open(caller_file, 'r') as f:
-        source_lines = f.readlines()
+    # (This may be called many times from the same file, e.g. in a loop, so the lines are cached.)
+    source_lines = _read_source_lines(caller_file)
 
     # Find the function call line
     call_line = caller_frame.f_lineno
@@ -55,16 +71,28 @@ def generate_comment(new_comment_content: str, *, above: bool = True, stack_dept
             break
 
     # Format the comment replacement
-    comment_indent = re.match(r'\s*', source_lines[call_line - 1]).group(0)  # pyright: ignore[reportOptionalMemberAccess]
+    call_line_text = source_lines[call_line - 1]
+    comment_indent = call_line_text[:len(call_line_text) - len(call_line_text.lstrip())]
     comment_line_start = f"{comment_indent}{special_comment_delimiter} "
-    new_comment_content = comment_line_start + f"\n{comment_line_start}".join(new_comment_content.splitlines())
+    # (An empty string still gets a comment line, consisting of just the delimiter.)
+    content_lines = new_comment_content.splitlines() or [""]
     if trim:
-        new_comment_content = "\n".join(line.rstrip() for line in new_comment_content.splitlines())
+        new_comment_content = "\n".join((comment_line_start + line).rstrip() for line in content_lines)
+    else:
+        new_comment_content = "\n".join(comment_line_start + line for line in content_lines)
 
     # Store the replacement
     old_comment_range = range(i + 1, call_line - 1) if above else range(call_line, i)  # pyright: ignore[reportUnboundVariable]
     replacements[caller_file].append((old_comment_range, new_comment_content))
 
+def _line_ending(line: bytes) -> bytes:
+    """Get the line ending of a line, defaulting to LF if it has none (i.e. the last line of a file)."""
+    if line.endswith(b"\r\n"):
+        return b"\r\n"
+    if line.endswith(b"\r"):
+        return b"\r"
+    return b"\n"
+
 def commit_comment_replacements(target_file: str | None = None):
     """
     Apply all comment replacements. This is called automatically when the program exits.
@@ -93,9 +121,10 @@ def commit_comment_replacements(target_file: str | None = None):
             continue
 
         # Read the entire source file
-        with open(file, 'r') as f:
+        # (as bytes, since the lines are only compared and written back out, so there's no need to decode them,
+        # and this way unrelated lines are kept byte-for-byte, including their line endings)
+        with open(file, 'rb') as f:
             source_lines = f.readlines()
-            original_source_lines = source_lines.copy()
 
         # Sort the replacements by decreasing line number
         file_replacements = sorted(file_replacements, reverse=True, key=lambda x: x[0].start)
@@ -103,34 +132,50 @@ def commit_comment_replacements(target_file: str | None = None):
         # Merge replacements that overlap, to support
         # calling generate_comment in a loop, or multiple times on one line.
         # Only need to merge exactly matching ranges, in either case,
-        # and since the list is sorted, only need to check adjacent items.
-        i = 0
-        while i < len(file_replacements) - 1:
-            current_item = file_replacements[i]
-            next_item = file_replacements[i + 1]
-
-            if current_item[0] == next_item[0]:
-                file_replacements[i] = (current_item[0], current_item[1] + "\n" + next_item[1])
-                del file_replacements[i + 1]
-            else:
-                i += 1
-
-        # Replace the comment lines with the new content
+        # and since the list is sorted, only need to group adjacent items.
+        file_replacements = [
+            (line_range, "\n".join(content for _, content in group))
+            for line_range, group in groupby(file_replacements, key=lambda x: x[0])
+        ]
+
+        # Replace the comment lines with the new content,
+        # keeping track of whether anything changed, and where
+        modified = False
+        first_modified_line = 0
         for line_range, new_comment_content in file_replacements:
-            source_lines[line_range.start:line_range.stop] = f"{new_comment_content}\n".splitlines(keepends=True)
+            # Use the same line endings as the existing comment, or the call line if there's no existing comment,
+            # to avoid mixing line endings (e.g. CRLF on Windows)
+            if line_range.start < len(source_lines):
+                reference_line = source_lines[line_range.start]
+            else:
+                reference_line = source_lines[line_range.start - 1]
+            newline = _line_ending(reference_line)
+            # (Python source files are UTF-8 by default.)
+            new_lines = [line + newline for line in new_comment_content.encode("utf-8").split(b"\n")]
+            if source_lines[line_range.start:line_range.stop] != new_lines:
+                source_lines[line_range.start:line_range.stop] = new_lines
+                modified = True
+                # Replacements are in decreasing order, so the last one modified is the first in the file.
+                first_modified_line = line_range.start
 
         # Write the source file back out
-        if tuple(source_lines) != tuple(original_source_lines):
-            # first_modified_line = min(line_range.start for line_range in replacements[file])
-            first_modified_line = 0
-            for a, b in zip(source_lines, original_source_lines):
-                if a != b:
-                    # print("first modified line:", first_modified_line, repr(a), repr(b))
-                    break
-                first_modified_line += 1
-
-            with open(file, 'w') as f:
-                f.writelines(source_lines)
+        # (to a temporary file which then replaces the original, so that
+        # an interrupted write can't leave the source file half-written)
+        if modified:
+            # (If the file is a symlink, replace the file it points to, not the symlink.)
+            real_file = os.path.realpath(file)
+            temp_file = f"{real_file}.{os.getpid()}.tmp"
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.writelines(source_lines)
+                shutil.copymode(real_file, temp_file)
+                os.replace(temp_file, real_file)
+            except BaseException:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                raise
+            # (The modification time may not change if the file system has coarse timestamps.)
+            _source_lines_cache.pop(file, None)
 
             print(f"""Updated generated comments ({special_comment_delimiter!r}) in {file!r}
 Note: Line numbers in this file (after {first_modified_line}) may have changed.
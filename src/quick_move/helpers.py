@@ -1,10 +1,12 @@
 """Utility functions."""
 
+import os
 import time
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
-import pyperclip
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QApplication
 
 
 # pyperclip.waitForPaste() was removed in v1.9.0, although PyperclipTimeoutException is still there.
@@ -15,16 +17,61 @@ def waitForPaste(timeout: float | None = None) -> str:
 
     This function raises PyperclipTimeoutException if timeout was set to
     a number of seconds that has elapsed without non-empty text being put on
-    the clipboard."""
-    startTime = time.time()
+    the clipboard.
+
+    If a QApplication is running, this waits for Qt's clipboard change notifications
+    instead of polling (which spawns a process per poll on Linux)."""
+    # pyperclip is imported here since it's fairly slow to import, and this module is used at startup (for merge_ranges).
+    import pyperclip
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance()
+    if isinstance(app, QApplication):
+        return _waitForPasteQt(app, timeout)
+
+    # The monotonic clock isn't affected by system clock changes.
+    deadline = None if timeout is None else time.monotonic() + timeout
+    # Poll quickly at first, since the clipboard is usually updated soon after the copy is triggered,
+    # then back off, since each poll can be fairly expensive.
+    delay = 0.002
     while True:
         clipboardText = pyperclip.paste()
         if clipboardText != '':
             return clipboardText
-        time.sleep(0.01)
-
-        if timeout is not None and time.time() > startTime + timeout:
+        if deadline is not None and time.monotonic() >= deadline:
             raise pyperclip.PyperclipTimeoutException('waitForPaste() timed out after ' + str(timeout) + ' seconds.')
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.05)
+
+
+def _waitForPasteQt(app: "QApplication", timeout: float | None) -> str:
+    """Event-driven implementation of waitForPaste()."""
+    import pyperclip
+    from PyQt6.QtCore import QEventLoop, QTimer
+
+    clipboard = app.clipboard()
+    assert clipboard is not None
+    loop = QEventLoop()
+    def check_clipboard():
+        # The clipboard may be changed to be empty, or to contain non-text data
+        if clipboard.text() != '':
+            loop.quit()
+    clipboard.dataChanged.connect(check_clipboard)  # pyright: ignore[reportUnknownMemberType]
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(loop.quit)  # pyright: ignore[reportUnknownMemberType]
+    try:
+        if clipboard.text() == '':
+            if timeout is not None:
+                timer.start(int(timeout * 1000))
+            loop.exec()
+    finally:
+        timer.stop()
+        clipboard.dataChanged.disconnect(check_clipboard)  # pyright: ignore[reportUnknownMemberType]
+
+    clipboardText = clipboard.text()
+    if clipboardText == '':
+        raise pyperclip.PyperclipTimeoutException('waitForPaste() timed out after ' + str(timeout) + ' seconds.')
+    return clipboardText
 
 
 def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
@@ -54,12 +101,14 @@ def tree(dir_path: Path, prefix: str='') -> Generator[str, None, None]:
     will yield a visual tree structure line by line
     with each line prefixed by the same characters
     """
-    contents = list(dir_path.iterdir())
+    # scandir gives the file type along with the names, so no stat is needed per entry (on most platforms)
+    with os.scandir(dir_path) as entries:
+        contents = sorted(entries, key=lambda entry: entry.name)
     # contents each get pointers that are ├── with a final └── :
     pointers = [tee] * (len(contents) - 1) + [last]
-    for pointer, path in zip(pointers, contents):
-        yield prefix + pointer + path.name
-        if path.is_dir(): # extend the prefix and recurse:
+    for pointer, entry in zip(pointers, contents):
+        yield prefix + pointer + entry.name
+        if entry.is_dir(follow_symlinks=False): # extend the prefix and recurse:
             extension = branch if pointer == tee else space
             # i.e. space because last, └── , above so no more |
-            yield from tree(path, prefix=prefix+extension)
+            yield from tree(Path(entry.path), prefix=prefix+extension)
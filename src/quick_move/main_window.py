@@ -1,125 +1,334 @@
 """The main window for the Quick Move application."""
 
+import json
 import os.path
-import shutil
+import stat
+from collections import OrderedDict
 from html import escape
 from typing import cast
+from weakref import WeakSet
+
+from PyQt6.QtCore import (QAbstractListModel, QEvent, QModelIndex, QObject,
+                          QPersistentModelIndex, QSettings, QSize, Qt,
+                          QThreadPool, QTimer, QUrl)
+from PyQt6.QtGui import (QAbstractTextDocumentLayout, QAction,
+                         QCloseEvent, QDesktopServices, QFont, QFontMetrics,
+                         QIcon, QKeyEvent, QPainter, QPalette, QTextDocument)
+from PyQt6.QtWidgets import (QApplication, QDialog, QLineEdit, QMainWindow,
+                             QMessageBox, QStyle, QStyledItemDelegate,
+                             QStyleOptionViewItem)
+
+import quick_move
+from quick_move.about_window_ui import Ui_Dialog as Ui_AboutDialog
+from quick_move.completer import Completion, get_completions, invalidate_listing_cache
+from quick_move.completion_job import CompletionJob, CompletionJobSignals
+from quick_move.main_window_ui import Ui_MainWindow
+from quick_move.move_job import MoveJob, move_path
+from quick_move.recent_move_dialog_ui import Ui_Dialog as Ui_RecentMoveDialog
+
+ICON_FILE = os.path.join(os.path.dirname(__file__), "icons", "folder-with-arrow.png")
 
-from PyQt6 import uic
-from PyQt6.QtCore import QEvent, QSettings, Qt, QTimer, QUrl
-from PyQt6.QtGui import QAction, QDesktopServices, QKeyEvent
-from PyQt6.QtWidgets import (QApplication, QDialog, QLabel, QLineEdit,
-                             QListWidget, QListWidgetItem, QMainWindow, QMenu,
-                             QMessageBox, QPushButton)
+MAX_HISTORY = 100
+MAX_LISTED_FILES = 20
+"""Maximum number of file names to show in the payload label."""
+SUGGESTIONS_UPDATE_DELAY_MS = 40
+
+# Plain int versions of enum values, for fast comparisons in event handlers
+KEY_Z = Qt.Key.Key_Z.value
+CONTROL_MODIFIER = Qt.KeyboardModifier.ControlModifier.value
+SHIFT_MODIFIER = Qt.KeyboardModifier.ShiftModifier.value
+KEY_RELEASE = QEvent.Type.KeyRelease.value
+
+COMPLETION_ROLE = Qt.ItemDataRole.UserRole
+"""Item data role for the `Completion` object of a suggestion."""
+HIGHLIGHT_HTML_ROLE = Qt.ItemDataRole.UserRole + 1
+"""Item data role for a suggestion's text as HTML, with matches highlighted."""
+
+HIGHLIGHT_START = "<span style='background-color: rgba(255, 255, 0, 0.5); font-weight: bold'>"
+HIGHLIGHT_END = "</span>"
+
+def highlight_html(text: str, highlights: list[tuple[int, int]]) -> str:
+    """Format text as HTML, with the given (sorted, non-overlapping) ranges highlighted."""
+    parts: list[str] = []
+    append = parts.append
+    last_idx = 0
+    for start, end in highlights:
+        append(escape(text[last_idx:start]))
+        append(HIGHLIGHT_START)
+        append(escape(text[start:end]))
+        append(HIGHLIGHT_END)
+        last_idx = end
+    append(escape(text[last_idx:]))
+    return "".join(parts)
+
+class SuggestionsModel(QAbstractListModel):
+    """Holds the suggestions shown in the suggestions list.
+
+    The list is updated in bulk, rather than item by item, which would emit signals for every change.
+    """
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._completions: list[Completion] = []
+        self._highlight_htmls: list[str] = []
+
+    def set_completions(self, completions: list[Completion]):
+        """Replace the suggestions.
+
+        While typing, the top suggestions often stay the same, so rows are only
+        removed and inserted after the part that's unchanged, and the rest are left alone.
+        """
+        old_completions = self._completions
+        unchanged = 0
+        for old, new in zip(old_completions, completions):
+            if old != new:
+                break
+            unchanged += 1
+        if unchanged < len(old_completions):
+            self.beginRemoveRows(QModelIndex(), unchanged, len(old_completions) - 1)
+            del self._completions[unchanged:]
+            del self._highlight_htmls[unchanged:]
+            self.endRemoveRows()
+        if unchanged < len(completions):
+            self.beginInsertRows(QModelIndex(), unchanged, len(completions) - 1)
+            self._completions.extend(completions[unchanged:])
+            self._highlight_htmls.extend(highlight_html(c.display_text, c.match_highlights) for c in completions[unchanged:])
+            self.endInsertRows()
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        # (This is a flat list, so only the root has rows.)
+        return 0 if parent.isValid() else len(self._completions)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> object:
+        row = index.row()
+        if not index.isValid() or row >= len(self._completions):
+            return None
+        completion = self._completions[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return completion.display_text
+        if role == HIGHLIGHT_HTML_ROLE:
+            return self._highlight_htmls[row]
+        if role == COMPLETION_ROLE:
+            return completion
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # (Only built when a tooltip is shown.)
+            return completion.path_str + "\n\nSort info (for debugging):\n" + repr(completion.sort_info)
+        return None
+
+class SuggestionDelegate(QStyledItemDelegate):
+    """Renders suggestions with highlighted matches.
+
+    This is much lighter than a QLabel per item, which was used previously.
+    """
+
+    MAX_CACHED_DOCUMENTS = 200
+    """Laid out documents are reused, since rows are painted repeatedly (hover, selection, scrolling), and sized for layout too."""
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._documents: OrderedDict[tuple[str, str], QTextDocument] = OrderedDict()
+        self._row_metrics: dict[str, tuple[QFontMetrics, int, int]] = {}
+        """Maps font keys to metrics for the bold version of the font, row height, and horizontal padding."""
+
+    def _layout_html(self, html: str, font: QFont) -> QTextDocument:
+        key = (html, font.key())
+        doc = self._documents.get(key)
+        if doc is not None:
+            self._documents.move_to_end(key)
+            return doc
+        doc = QTextDocument()
+        doc.setDocumentMargin(0)
+        doc.setDefaultFont(font)
+        doc.setHtml(html)
+        self._documents[key] = doc
+        if len(self._documents) > self.MAX_CACHED_DOCUMENTS:
+            self._documents.popitem(last=False)
+        return doc
+
+    def paint(self, painter: QPainter | None, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> None:
+        assert painter is not None
+        self.initStyleOption(option, index)
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        assert style is not None
+
+        # Draw the background, selection, focus rect, etc. without the text
+        option.text = ""
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, widget)
+
+        # Draw the text with highlights
+        text_rect = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, option, widget)
+        doc = self._layout_html(index.data(HIGHLIGHT_HTML_ROLE), option.font)
+        context = QAbstractTextDocumentLayout.PaintContext()
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        context.palette.setColor(QPalette.ColorRole.Text, option.palette.color(QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text))
+        painter.save()
+        painter.translate(text_rect.left(), text_rect.top() + (text_rect.height() - doc.size().height()) / 2)
+        painter.setClipRect(0, 0, text_rect.width(), text_rect.height())
+        doc.documentLayout().draw(painter, context)  # pyright: ignore[reportOptionalMemberAccess]
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
+        # The list view asks for the size of every row, not just the visible ones,
+        # so rows are measured with font metrics rather than laid out as documents.
+        # All rows are one line of text, so they have the same height, which is measured once per font.
+        # The width is measured as if all the text were bold (highlighted), so it's never too narrow.
+        font_key = option.font.key()
+        row_metrics = self._row_metrics.get(font_key)
+        if row_metrics is None:
+            bold_font = QFont(option.font)
+            bold_font.setBold(True)
+            bold_metrics = QFontMetrics(bold_font)
+            size = super().sizeHint(option, index)
+            doc = self._layout_html(index.data(HIGHLIGHT_HTML_ROLE), option.font)
+            row_height = max(size.height(), int(doc.size().height()))
+            widget = option.widget
+            style = widget.style() if widget is not None else QApplication.style()
+            assert style is not None
+            padding = (style.pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, option, widget) + 1) * 2
+            row_metrics = self._row_metrics[font_key] = (bold_metrics, row_height, padding)
+        bold_metrics, row_height, padding = row_metrics
+        return QSize(bold_metrics.horizontalAdvance(index.data(Qt.ItemDataRole.DisplayRole)) + padding, row_height)
+
+class AboutDialog(QDialog, Ui_AboutDialog):
+    """The About dialog, compiled from about_window.ui (see compile_ui.sh)"""
+    def __init__(self):
+        super().__init__()
+        self.setupUi(self)
 
-from quick_move import __version__
-from quick_move.completer import get_completions
+class RecentMoveDialog(QDialog, Ui_RecentMoveDialog):
+    """The dialog for a move in the History menu, compiled from recent_move_dialog.ui (see compile_ui.sh)"""
+    def __init__(self):
+        super().__init__()
+        self.setupUi(self)
 
-UI_FILE = os.path.join(os.path.dirname(__file__), "main_window.ui")
-ABOUT_UI_FILE = os.path.join(os.path.dirname(__file__), "about_window.ui")
-RECENT_MOVE_UI_FILE = os.path.join(os.path.dirname(__file__), "recent_move_dialog.ui")
+class MainWindow(QMainWindow, Ui_MainWindow):
+    _settings: QSettings | None = None
+    """Shared settings object, created on first use."""
+    _recent_moves_cache: list[dict[str, str | list[str]]] | None = None
+    """In-memory copy of the `recentMoves` setting, to avoid re-reading it from disk (or the registry) just to show the History menu.
 
-MAX_HISTORY = 100
+    It's re-read before the history is changed, since other Quick Move processes may have changed it.
+    """
+    _instances: "WeakSet[MainWindow]" = WeakSet()
+    """All open windows, for updating their History menus."""
 
-class MainWindow(QMainWindow):
     def __init__(self, payload: list[str], destination_scope: str):
         super().__init__()
+        MainWindow._instances.add(self)
 
         self.payload = payload
         self.destination_scope = destination_scope
 
-        # Load the .ui file
-        # TODO: try compiling the .ui file to a .py file; it might help with type checking
-        # Pyright gives "reportPrivateImportUsage" because it doesn't find anything in the PyQt6 module,
-        # I guess because it uses pkgutil.extend_path rather than explicit imports?
-        # Although, `from PyQt6.uic import loadUi` (equally functional) gives the same error.
-        uic.loadUi(UI_FILE, self)  # pyright: ignore[reportUnknownMemberType, reportPrivateImportUsage]
-
-        self.payloadLabel: QLabel
-        self.destinationEdit: QLineEdit
-        self.suggestionsListWidget: QListWidget
-        self.moveButton: QPushButton
-        self.menuHistory: QMenu
-
-        self.actionQuit: QAction
-        self.actionAbout_Quick_Move: QAction
-        self.actionAbout_Qt: QAction
+        # Set up the UI, compiled from main_window.ui (see compile_ui.sh)
+        self.setupUi(self)
+        # The icon path in the .ui file is relative to the .ui file, but compiled code resolves it relative to the working directory.
+        self.setWindowIcon(QIcon(ICON_FILE))
 
         # Handle button clicks
         # (could do this with an action, for consistency...)
         self.moveButton.clicked.connect(self.move_files)  # pyright: ignore[reportUnknownMemberType]
 
+        # State for moving files in the background
+        # (The job is kept until the window closes, so that its signals stay alive, and so that only one move is started.)
+        self.moveJob: MoveJob | None = None
+        self.moveFinished = False
+        self.moveErrors: list[str] = []
+        self.movedFiles: list[str] = []
+
         # Handle menu actions
         self.actionQuit.triggered.connect(self.close)  # pyright: ignore[reportUnknownMemberType]
         self.actionAbout_Quick_Move.triggered.connect(self.show_about)  # pyright: ignore[reportUnknownMemberType]
         self.actionAbout_Qt.triggered.connect(QApplication.aboutQt)  # pyright: ignore[reportUnknownMemberType]
-        # Create recent move actions
-        self.historyActions: list[QAction] = []
-        # self.separatorAct = self.menuHistory.addSeparator()
-        # TODO: placeholder disabled item (empty menu is confusing)
-        for _i in range(MAX_HISTORY):
-            act = QAction(self)
-            act.setVisible(False)
-            act.triggered.connect(self.historyItemClicked)  # pyright: ignore[reportUnknownMemberType]
-            self.historyActions.append(act)
-
-        # Add recent move actions to the menu
-        self.menuHistory.addActions(self.historyActions)  # pyright: ignore[reportUnknownMemberType]
-        self.updateHistoryActions()
         # Add Clear History action
         clear_history_action = QAction("Clear History", self)
         clear_history_action.triggered.connect(self.clearHistory)  # pyright: ignore[reportUnknownMemberType]
-        self.menuHistory.addSeparator()
+        self.historySeparator = cast(QAction, self.menuHistory.addSeparator())
         self.menuHistory.addAction(clear_history_action)  # pyright: ignore[reportUnknownMemberType]
+        # Recent move actions are created as needed, and inserted above the separator
+        # TODO: placeholder disabled item (empty menu is confusing)
+        self.historyActions: list[QAction] = []
+        self._numVisibleHistoryActions = 0
+        self.updateHistoryActions()
 
         # Populate info about selected files
         self.payloadLabel.setTextFormat(Qt.TextFormat.PlainText)
-        self.payloadLabel.setText(f"Moving {len(payload)} file{'' if len(payload) == 1 else 's'}: {', '.join([os.path.basename(file) for file in payload])}" if payload else '⚠️ No files selected. The quick-move program should be run with files as arguments.')
+        if payload:
+            num_files = len(payload)
+            names = ', '.join(os.path.basename(file) for file in payload[:MAX_LISTED_FILES])
+            if num_files > MAX_LISTED_FILES:
+                names += f", and {num_files - MAX_LISTED_FILES} more"
+            self.payloadLabel.setText(f"Moving {num_files} file{'' if num_files == 1 else 's'}: {names}")
+        else:
+            self.payloadLabel.setText('⚠️ No files selected. The quick-move program should be run with files as arguments.')
 
         # Handle destination directory input
-        self.destinationEdit.textChanged.connect(self.update_suggestions)  # pyright: ignore[reportUnknownMemberType]
+        # Suggestions are updated right away for the first keystroke, but then only after a short delay,
+        # so that fast typing (or pasting) doesn't search the file system for every intermediate keystroke.
+        self.suggestionsUpdateTimer = QTimer(self)
+        self.suggestionsUpdateTimer.setSingleShot(True)
+        self.suggestionsUpdateTimer.setInterval(SUGGESTIONS_UPDATE_DELAY_MS)
+        self.suggestionsUpdateTimer.timeout.connect(self.flush_suggestions_update)  # pyright: ignore[reportUnknownMemberType]
+        self.suggestionsUpdatePending = False
+        # Suggestions are searched for in the background, one search at a time.
+        # Each search is numbered, so that results of outdated searches can be ignored.
+        self.suggestionsThreadPool = QThreadPool(self)
+        self.suggestionsThreadPool.setMaxThreadCount(1)
+        # One signals object is shared by all the searches, owned by the window,
+        # so that it isn't deleted while a search is still running.
+        self.suggestionsSignals = CompletionJobSignals(self)
+        self.suggestionsSignals.finished.connect(self.show_suggestions)  # pyright: ignore[reportUnknownMemberType]
+        self.suggestionsQueryNumber = 0
+        self.suggestionsShownQueryNumber = 0
+        self.destinationEdit.textChanged.connect(self.schedule_suggestions_update)  # pyright: ignore[reportUnknownMemberType]
         self.destinationEdit.setText(destination_scope)
         self.destinationEdit.focusNextPrevChild = lambda next: True
         self.destinationEdit.setFocus()
 
-        def handle_destination_edit_event(a0: QEvent | None) -> bool:
-            """Handle events on the destination input field."""
-            event = a0
-            if isinstance(event, QKeyEvent):
-                # print(f"DestinationEdit key event: {event.key()} (Qt.Key.{Qt.Key(event.key()).name}), modifiers: {event.modifiers()} (Qt.KeyboardModifier.{Qt.KeyboardModifier(event.modifiers()).name}), type: {event.type()} (QEvent.Type.{QEvent.Type(event.type()).name})")
-                if (
-                    event.key() == Qt.Key.Key_Z and
-                    (event.modifiers() & ~Qt.KeyboardModifier.ShiftModifier) == Qt.KeyboardModifier.ControlModifier and
-                    event.type() != QEvent.Type.KeyRelease
-                ):
-                    # Place cursor at end of the field if Ctrl+Z or Ctrl+Shift+Z is pressed
-                    # and everything is selected.
-                    # This works around the selectAll()+insert() leaving everything selected in the undo state
-                    # when accepting a suggestion.
-
-                    def place_cursor_at_end():
-                        # print("Text matches selection?", self.destinationEdit.selectedText() == self.destinationEdit.text(),
-                        #     "Text:", self.destinationEdit.text(),
-                        #     "Selected text:", self.destinationEdit.selectedText(),
-                        #     "Cursor position:", self.destinationEdit.cursorPosition(),
-                        #     "Selection start:", self.destinationEdit.selectionStart(),
-                        #     "Selection end:", self.destinationEdit.selectionEnd(),
-                        #     "Selection length:", self.destinationEdit.selectionLength(),
-                        #     "Text length:", len(self.destinationEdit.text()))
-
-                        # if self.destinationEdit.selectedText() == self.destinationEdit.text():
-                        if self.destinationEdit.selectionLength() == len(self.destinationEdit.text()):
-                            # print("Placing cursor at end of destinationEdit.")
-                            self.destinationEdit.end(False)
-
-                    QTimer.singleShot(0, place_cursor_at_end)  # pyright: ignore[reportUnknownMemberType]
-
-            return super(QLineEdit, self.destinationEdit).event(event)
-
-        self.destinationEdit.event = handle_destination_edit_event
-
-        # Keep the destinationEdit input field focused if you click on the suggestions list widget.
-        self.suggestionsListWidget.setFocusProxy(self.destinationEdit)
+        self.destinationEdit.event = self.handle_destination_edit_event
+
+        self.suggestionsModel = SuggestionsModel(self)
+        self.suggestionsListView.setModel(self.suggestionsModel)
+        self.suggestionsListView.setItemDelegate(SuggestionDelegate(self.suggestionsListView))
+
+        # Keep the destinationEdit input field focused if you click on the suggestions list view.
+        self.suggestionsListView.setFocusProxy(self.destinationEdit)
+
+    def handle_destination_edit_event(self, a0: QEvent | None) -> bool:
+        """Handle events on the destination input field."""
+        event = a0
+        if isinstance(event, QKeyEvent):
+            # print(f"DestinationEdit key event: {event.key()} (Qt.Key.{Qt.Key(event.key()).name}), modifiers: {event.modifiers()} (Qt.KeyboardModifier.{Qt.KeyboardModifier(event.modifiers()).name}), type: {event.type()} (QEvent.Type.{QEvent.Type(event.type()).name})")
+            # (This runs for every key event, so it compares plain ints, bound once at module level.)
+            if (
+                event.key() == KEY_Z and
+                (event.modifiers().value & ~SHIFT_MODIFIER) == CONTROL_MODIFIER and
+                event.type() != KEY_RELEASE
+            ):
+                # Place cursor at end of the field if Ctrl+Z or Ctrl+Shift+Z is pressed
+                # and everything is selected.
+                # This works around the selectAll()+insert() leaving everything selected in the undo state
+                # when accepting a suggestion.
+
+                QTimer.singleShot(0, self.place_cursor_at_end_if_all_selected)  # pyright: ignore[reportUnknownMemberType]
+
+        return super(QLineEdit, self.destinationEdit).event(event)
+
+    def place_cursor_at_end_if_all_selected(self):
+        """Deselect and place the cursor at the end of the destination field, if all of its text is selected."""
+        # print("Text matches selection?", self.destinationEdit.selectedText() == self.destinationEdit.text(),
+        #     "Text:", self.destinationEdit.text(),
+        #     "Selected text:", self.destinationEdit.selectedText(),
+        #     "Cursor position:", self.destinationEdit.cursorPosition(),
+        #     "Selection start:", self.destinationEdit.selectionStart(),
+        #     "Selection end:", self.destinationEdit.selectionEnd(),
+        #     "Selection length:", self.destinationEdit.selectionLength(),
+        #     "Text length:", len(self.destinationEdit.text()))
+
+        # if self.destinationEdit.selectedText() == self.destinationEdit.text():
+        if self.destinationEdit.selectionLength() == len(self.destinationEdit.text()):
+            # print("Placing cursor at end of destinationEdit.")
+            self.destinationEdit.end(False)
 
     def event(self, event: QEvent | None) -> bool:
         if isinstance(event, QKeyEvent):
@@ -138,6 +347,22 @@ class MainWindow(QMainWindow):
 
         return super(MainWindow, self).event(event)
 
+    def closeEvent(self, a0: QCloseEvent | None) -> None:
+        """Don't close while files are being moved, since quitting would interrupt the move.
+
+        Also wait for any search in progress, so it doesn't outlive the window.
+        """
+        event = a0
+        assert event is not None
+        if self.moveJob is not None and not self.moveFinished:
+            # The window closes itself once the move is finished.
+            event.ignore()
+            return
+        self.suggestionsUpdateTimer.stop()
+        self.suggestionsThreadPool.clear()
+        self.suggestionsThreadPool.waitForDone()
+        super().closeEvent(event)
+
     # Argument is named generically as `a0` in PyQt6, hence the "incompatibility"
     # Also the event type is Optional. I don't know why yet.
     def keyPressEvent(self, event: QKeyEvent) -> None:  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -150,9 +375,9 @@ class MainWindow(QMainWindow):
             self.accept_suggestion()
             self.move_files()
         elif key == Qt.Key.Key_Up:
-            self.suggestionsListWidget.setCurrentRow(max(0, self.suggestionsListWidget.currentRow() - 1))
+            self.select_suggestion(self.suggestionsListView.currentIndex().row() - 1)
         elif key == Qt.Key.Key_Down:
-            self.suggestionsListWidget.setCurrentRow(min(self.suggestionsListWidget.count() - 1, self.suggestionsListWidget.currentRow() + 1))
+            self.select_suggestion(self.suggestionsListView.currentIndex().row() + 1)
         # See event() method for Tab handling.
         # elif key == Qt.Key.Key_Tab:
         #     self.accept_suggestion()
@@ -161,13 +386,18 @@ class MainWindow(QMainWindow):
 
     def accept_suggestion(self):
         """Accept the currently selected suggestion and update the destination input field."""
-        item = self.suggestionsListWidget.currentItem()
-        if item is not None:
-            label = self.suggestionsListWidget.itemWidget(item)
-            if label is not None:
-                # Don't use text() because it will include the HTML from match_highlights
-                # (not to mention we might want it to display a relative path)
-                new_text = str(label.property("suggestion").path) + os.path.sep
+        # Make sure the suggestions aren't stale
+        self.flush_suggestions_update()
+        if self.suggestionsShownQueryNumber != self.suggestionsQueryNumber:
+            # Waiting for the background search could take a while, but it's needed now.
+            self.suggestionsQueryNumber += 1
+            self.show_suggestions(get_completions(self.destinationEdit.text(), self.destination_scope), self.suggestionsQueryNumber)
+        index = self.suggestionsListView.currentIndex()
+        if index.isValid():
+            completion: Completion | None = index.data(COMPLETION_ROLE)
+            if completion is not None:
+                # Don't use the display text, since we might want it to display a relative path
+                new_text = completion.path_str + os.path.sep
                 # Instead of self.destinationEdit.setText, which will erase undo history,
                 # use the QTextCursor API to set the text in an undoable way.
                 # ...textCursor method doesn't seem to exist on QLineEdit...
@@ -191,68 +421,148 @@ class MainWindow(QMainWindow):
 
     def move_files(self):
         """Move selected files to the target directory, and exit if successful."""
+        if self.moveJob is not None:
+            # Already moving (or moved) the files, e.g. if Enter is pressed again during the move.
+            return
         destination = self.destinationEdit.text().strip()
         if not destination:
             # There's a potential UX issue if you want to move files to the root of the configured destination scope.
             # Right now I guess it'll just give you this error message.
             QMessageBox.warning(self, "Warning", "Please specify a destination directory.")
             return
-        if not os.path.exists(destination):
+        # One stat call tells whether the destination exists and whether it's a directory.
+        try:
+            is_dir = stat.S_ISDIR(os.stat(destination).st_mode)
+        except OSError:
             if QMessageBox.question(self, "Create Directory", f"The destination '{destination}' does not exist. Do you want to create it?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
                 try:
                     os.makedirs(destination, exist_ok=True)
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to create directory '{destination}': {e}")
                     return
+                is_dir = True
             else:
                 return
-        if not os.path.isdir(destination):
+        if not is_dir:
             QMessageBox.warning(self, "Warning", f"The destination '{destination}' is not a directory.")
             return
 
-        self.record_move(self.payload, destination)
-
-        # TODO: Can we do this atomically?
-        # Or make this more flexible, like prompt to undo, retry, skip, or (if applicable) overwrite
-        # (Would be easier if we could reuse a file manager / OS dialog for this, either with an API or desktop automation.)
-        for file in self.payload:
-            try:
-                shutil.move(file, destination)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to move '{file}' to '{destination}': {e}")
-
-        self.close()
+        # Move the files on a background thread, since it may take a while,
+        # e.g. if copying is needed to move between file systems.
+        self.moveButton.setDisabled(True)
+        self.destinationEdit.setDisabled(True)
+        # Show that it's working, since the window stays open until all the files are moved.
+        self.setCursor(Qt.CursorShape.BusyCursor)
+        self.moveErrors.clear()
+        self.movedFiles.clear()
+        self.moveJob = MoveJob(self.payload, destination)
+        self.moveJob.signals.fileMoved.connect(self.on_file_moved)  # pyright: ignore[reportUnknownMemberType]
+        self.moveJob.signals.finished.connect(self.on_move_finished)  # pyright: ignore[reportUnknownMemberType]
+        QThreadPool.globalInstance().start(self.moveJob)  # pyright: ignore[reportOptionalMemberAccess]
+
+    def on_file_moved(self, file: str, destination: str, error: str):
+        """Collect results from the move job, and show progress."""
+        if error:
+            self.moveErrors.append(f"Failed to move '{file}' to '{destination}': {error}")
+        else:
+            self.movedFiles.append(file)
+        num_done = len(self.movedFiles) + len(self.moveErrors)
+        num_files = len(self.payload)
+        self.payloadLabel.setText(f"Moving {num_files} file{'' if num_files == 1 else 's'}... ({num_done} of {num_files} done)")
+
+    def on_move_finished(self):
+        """Record the files that were moved, report any errors from the move job, and exit."""
+        self.moveFinished = True
+        if self.moveJob is not None:
+            # Only files that were actually moved can be undone
+            # (Recorded once for the whole move, since reading and writing the history for every file would add up.
+            # The window can't be closed during the move, so it isn't interrupted before this.)
+            if self.movedFiles:
+                self.record_move(list(self.movedFiles), self.moveJob.destination)
+            invalidate_listing_cache(self.moveJob.destination)
+            for file in self.moveJob.files:
+                invalidate_listing_cache(os.path.dirname(file))
+        self.unsetCursor()
+        if self.moveErrors:
+            QMessageBox.critical(self, "Error", "\n\n".join(self.moveErrors))
+        QTimer.singleShot(0, self.close)  # pyright: ignore[reportUnknownMemberType]
+
+    def schedule_suggestions_update(self):
+        """Update the suggestions now if they haven't been updated recently, otherwise once typing pauses."""
+        if self.suggestionsUpdateTimer.isActive():
+            self.suggestionsUpdatePending = True
+        else:
+            self.update_suggestions()
+        self.suggestionsUpdateTimer.start()
+
+    def flush_suggestions_update(self):
+        """Update the suggestions if an update is pending."""
+        if self.suggestionsUpdatePending:
+            self.suggestionsUpdatePending = False
+            self.update_suggestions()
 
     def update_suggestions(self):
-        """Update the suggestions list based on the destination directory input."""
-        suggestions = get_completions(self.destinationEdit.text(), self.destination_scope)
+        """Start searching for suggestions based on the destination directory input."""
+        self.suggestionsQueryNumber += 1
+        job = CompletionJob(self.destinationEdit.text(), self.destination_scope, self.suggestionsQueryNumber, self.suggestionsSignals)
+        # Drop any search that hasn't started yet, since it's outdated
+        self.suggestionsThreadPool.clear()
+        self.suggestionsThreadPool.start(job)
+
+    def show_suggestions(self, suggestions: list[Completion], query_number: int):
+        """Update the suggestions list with the results of a search, unless the search is outdated."""
+        if query_number != self.suggestionsQueryNumber:
+            return
+        self.suggestionsShownQueryNumber = query_number
         # TODO: icons/styling for directories to be created, AI suggestions
-        self.suggestionsListWidget.clear()
-        self.suggestionsListWidget.clear()
-        for suggestion in suggestions:
-            text = suggestion.display_text
-            html = ""
-            last_idx = 0
-            for start, end in suggestion.match_highlights:
-                html += escape(text[last_idx:start])
-                html += f"<span style='background-color: rgba(255, 255, 0, 0.5); font-weight: bold'>{escape(text[start:end])}</span>"
-                last_idx = end
-            html += escape(text[last_idx:])
-            label = QLabel()
-            label.setTextFormat(Qt.TextFormat.RichText)
-            label.setText(html)
-            label.setToolTip(str(suggestion.path) + "\n\nSort info (for debugging):\n" + repr(suggestion.sort_info))
-            label.setProperty("suggestion", suggestion)
-            # label.setStyleSheet("QLabel { padding: 2px; }")  # this doesn't expand the label size, so it doesn't work
-            item = QListWidgetItem()
-            self.suggestionsListWidget.addItem(item)
-            self.suggestionsListWidget.setItemWidget(item, label)
-        self.suggestionsListWidget.setCurrentRow(0)
+        self.suggestionsModel.set_completions(suggestions)
+        self.select_suggestion(0)
+
+    def select_suggestion(self, row: int):
+        """Select the suggestion at the given row, clamped to the list."""
+        row = max(0, min(row, self.suggestionsModel.rowCount() - 1))
+        self.suggestionsListView.setCurrentIndex(self.suggestionsModel.index(row))
+
+    @classmethod
+    def _get_settings(cls) -> QSettings:
+        if cls._settings is None:
+            cls._settings = QSettings('Isaiah Odhner', 'Quick Move')
+            # Changes are written out from the event loop, but make sure they're written before exiting,
+            # since this shared object may otherwise never be destroyed properly.
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(cls._settings.sync)  # pyright: ignore[reportUnknownMemberType]
+        return cls._settings
+
+    @classmethod
+    def _load_moves(cls, reload: bool = False) -> list[dict[str, str | list[str]]]:
+        """Get the recent moves, reading from settings the first time, or if `reload` is true."""
+        if cls._recent_moves_cache is None or reload:
+            settings = cls._get_settings()
+            if reload:
+                # Pick up changes from other processes
+                # (This also writes out any changes from this process that QSettings hasn't written yet.)
+                settings.sync()
+            value = settings.value('recentMoves', '[]')
+            if isinstance(value, str):
+                cls._recent_moves_cache = json.loads(value)
+            else:
+                # Older versions stored the list directly, as a QVariant.
+                # An empty list is read back as None (at least with the INI backend)
+                cls._recent_moves_cache = value or []
+        return cls._recent_moves_cache
+
+    @classmethod
+    def _save_moves(cls, moves: list[dict[str, str | list[str]]]):
+        """Update the recent moves, writing through to settings."""
+        cls._recent_moves_cache = moves
+        # Stored as JSON, which is faster to (de)serialize than nested QVariants, and human-readable
+        # (QSettings writes it out shortly after, from the event loop.)
+        cls._get_settings().setValue('recentMoves', json.dumps(moves))
 
     def record_move(self, files: list[str], destination: str):
         """Record the move operation for the History menu."""
-        settings = QSettings('Isaiah Odhner', 'Quick Move')
-        moves = settings.value('recentMoves', [])
+        moves = self._load_moves(reload=True)
 
         moves.insert(0, {
             'files': files,
@@ -260,35 +570,47 @@ class MainWindow(QMainWindow):
         })
         del moves[MAX_HISTORY:]
 
-        settings.setValue('recentMoves', moves)
+        self._save_moves(moves)
 
-        for widget in QApplication.topLevelWidgets():
-            if isinstance(widget, MainWindow):
-                widget.updateHistoryActions()
+        for window in MainWindow._instances:
+            window.updateHistoryActions(moves)
 
-    def updateHistoryActions(self):
-        settings = QSettings('Isaiah Odhner', 'Quick Move')
-        moves = settings.value('recentMoves', [])
+    def updateHistoryActions(self, moves: list[dict[str, str | list[str]]] | None = None):
+        """Update the History menu to show the recent moves, which are loaded from the settings if not given."""
+        if moves is None:
+            moves = self._load_moves()
 
         numRecentMoves = min(len(moves), MAX_HISTORY)
 
+        while len(self.historyActions) < numRecentMoves:
+            act = QAction(self)
+            act.triggered.connect(self.historyItemClicked)  # pyright: ignore[reportUnknownMemberType]
+            self.menuHistory.insertAction(self.historySeparator, act)
+            self.historyActions.append(act)
+
         for i in range(numRecentMoves):
-            text = moves[i]['destination']
+            move = moves[i]
+            text = move['destination']
             if i < 9:
                 text = f"&{i + 1} {text}"
-            self.historyActions[i].setText(text)
-            self.historyActions[i].setData(moves[i])
-            self.historyActions[i].setVisible(True)
+            act = self.historyActions[i]
+            act.setText(text)
+            act.setData({'index': i, 'move': move})
+            act.setVisible(True)
 
-        for j in range(numRecentMoves, MAX_HISTORY):
+        # Only actions that were shown last time need hiding
+        for j in range(numRecentMoves, self._numVisibleHistoryActions):
             self.historyActions[j].setVisible(False)
+        self._numVisibleHistoryActions = numRecentMoves
 
-        # self.separatorAct.setVisible((numRecentMoves > 0))
+        # self.historySeparator.setVisible((numRecentMoves > 0))
 
     def historyItemClicked(self):
         """Show a dialog with options to undo the move or open the destination directory."""
         action = cast(QAction, self.sender())
-        move = cast(dict[str, str|list[str]], action.data())
+        data = action.data()
+        move = cast(dict[str, str|list[str]], data['move'])
+        index = cast(int, data['index'])
 
         # TODO: ensure destination label is fully readable, with scrollbar if necessary
 
@@ -307,19 +629,22 @@ class MainWindow(QMainWindow):
         # with "<- Undo" and "Redo ->" buttons, and "Open Source Directories" and "Open Destination Directory" buttons,
         # with two text areas showing which files are currently in either folder (usually one or the other, but both in the case of partial failure)
 
-        dialog: QDialog = uic.loadUi(RECENT_MOVE_UI_FILE)  # type: ignore
+        dialog = RecentMoveDialog()
         dialog.setWindowTitle("Recent Move")
-        dialog.movedFilesTextBrowser.setText("\n".join(move['files']))  # type: ignore
-        dialog.destinationLabel.setText(f"Destination: {move['destination']}")  # type: ignore
+        dialog.movedFilesTextBrowser.setText("\n".join(move['files']))
+        dialog.destinationLabel.setText(f"Destination: {move['destination']}")
         def undo_and_disable():
-            self.undoMove(move)
-            dialog.undoMoveButton.setDisabled(True)  # type: ignore
-        dialog.undoMoveButton.clicked.connect(undo_and_disable)  # type: ignore
-        dialog.openDestinationButton.clicked.connect(lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(cast(str, move['destination']))))  # type: ignore
+            self.undoMove(move, index)
+            dialog.undoMoveButton.setDisabled(True)
+        dialog.undoMoveButton.clicked.connect(undo_and_disable)  # pyright: ignore[reportUnknownMemberType]
+        dialog.openDestinationButton.clicked.connect(lambda: QDesktopServices.openUrl(QUrl.fromLocalFile(cast(str, move['destination']))))  # pyright: ignore[reportUnknownMemberType]
         dialog.exec()
 
-    def undoMove(self, move: dict[str, str|list[str]]):
-        """Undo a move operation by moving the files back to their original locations."""
+    def undoMove(self, move: dict[str, str|list[str]], index: int | None = None):
+        """Undo a move operation by moving the files back to their original locations.
+
+        `index` is the move's position in the history, if known, to avoid searching for it.
+        """
         # TODO: Can we do this atomically?
         # Or make this more flexible, like prompt to undo, retry, skip, or (if applicable) overwrite
         # (Would be easier if we could reuse a file manager / OS dialog for this, either with an API or desktop automation.)
@@ -329,32 +654,35 @@ class MainWindow(QMainWindow):
         for original_path in files:
             path_in_destination = os.path.join(destination, os.path.basename(original_path))
             try:
-                shutil.move(path_in_destination, original_path)
+                move_path(path_in_destination, original_path)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to move file '{path_in_destination}' back to '{original_path}': {e}")
+            invalidate_listing_cache(os.path.dirname(original_path))
+        invalidate_listing_cache(destination)
 
         # Remove the move from the history
         # Not sure this is a good idea, might be better to mark it as undone instead.
-        settings = QSettings('Isaiah Odhner', 'Quick Move')
-        moves = settings.value('recentMoves', [])
-        moves = [m for m in moves if m != move]
-        settings.setValue('recentMoves', moves)
+        moves = self._load_moves(reload=True)
+        # The history may have changed since the index was obtained (e.g. moves made in another window)
+        if index is not None and index < len(moves) and moves[index] == move:
+            del moves[index]
+        else:
+            moves = [m for m in moves if m != move]
+        self._save_moves(moves)
 
-        for widget in QApplication.topLevelWidgets():
-            if isinstance(widget, MainWindow):
-                widget.updateHistoryActions()
+        for window in MainWindow._instances:
+            window.updateHistoryActions(moves)
 
     def clearHistory(self):
         """Clear the history of recent moves."""
         # In the future this might mention how this history can be used for improving suggestions, as well as undoing moves.
         if QMessageBox.question(self, "Clear History", "Are you sure you want to clear the history of recent moves?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) != QMessageBox.StandardButton.Yes:
             return
-        settings = QSettings('Isaiah Odhner', 'Quick Move')
-        settings.setValue('recentMoves', [])
-        self.updateHistoryActions()
+        self._save_moves([])
+        self.updateHistoryActions([])
 
     def show_about(self):
         """Show the about dialog."""
-        dialog: QDialog = uic.loadUi(ABOUT_UI_FILE)  # type: ignore
-        dialog.version_label.setText(f"{__version__}")  # type: ignore
+        dialog = AboutDialog()
+        dialog.version_label.setText(f"{quick_move.__version__}")
         dialog.exec()
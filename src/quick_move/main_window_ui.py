@@ -0,0 +1,110 @@
+# Form implementation generated from reading ui file 'main_window.ui'
+#
+# Created by: PyQt6 UI code generator 6.9.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(800, 600)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/folder-with-arrow.png"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        MainWindow.setWindowIcon(icon)
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(11, 11, 11, 11)
+        self.verticalLayout.setSpacing(6)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.scrollArea = QtWidgets.QScrollArea(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.scrollArea.sizePolicy().hasHeightForWidth())
+        self.scrollArea.setSizePolicy(sizePolicy)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setObjectName("scrollArea")
+        self.scrollAreaWidgetContents = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 780, 68))
+        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_2.setContentsMargins(11, 11, 11, 11)
+        self.verticalLayout_2.setSpacing(6)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.payloadLabel = QtWidgets.QLabel(parent=self.scrollAreaWidgetContents)
+        self.payloadLabel.setObjectName("payloadLabel")
+        self.verticalLayout_2.addWidget(self.payloadLabel)
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+        self.verticalLayout.addWidget(self.scrollArea)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSpacing(6)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.destinationEdit = QtWidgets.QLineEdit(parent=self.centralwidget)
+        self.destinationEdit.setObjectName("destinationEdit")
+        self.horizontalLayout_2.addWidget(self.destinationEdit)
+        self.moveButton = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.moveButton.setObjectName("moveButton")
+        self.horizontalLayout_2.addWidget(self.moveButton)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.suggestionsListView = QtWidgets.QListView(parent=self.centralwidget)
+        self.suggestionsListView.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.suggestionsListView.setBatchSize(20)
+        self.suggestionsListView.setObjectName("suggestionsListView")
+        self.verticalLayout.addWidget(self.suggestionsListView)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 800, 22))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(parent=self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuAbout = QtWidgets.QMenu(parent=self.menubar)
+        self.menuAbout.setObjectName("menuAbout")
+        self.menuHistory = QtWidgets.QMenu(parent=self.menubar)
+        self.menuHistory.setObjectName("menuHistory")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.actionAbout_Quick_Move = QtGui.QAction(parent=MainWindow)
+        self.actionAbout_Quick_Move.setMenuRole(QtGui.QAction.MenuRole.AboutRole)
+        self.actionAbout_Quick_Move.setObjectName("actionAbout_Quick_Move")
+        self.actionAbout_Qt = QtGui.QAction(parent=MainWindow)
+        self.actionAbout_Qt.setMenuRole(QtGui.QAction.MenuRole.AboutQtRole)
+        self.actionAbout_Qt.setObjectName("actionAbout_Qt")
+        self.actionQuit = QtGui.QAction(parent=MainWindow)
+        self.actionQuit.setMenuRole(QtGui.QAction.MenuRole.QuitRole)
+        self.actionQuit.setObjectName("actionQuit")
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionQuit)
+        self.menuAbout.addAction(self.actionAbout_Quick_Move)
+        self.menuAbout.addAction(self.actionAbout_Qt)
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuHistory.menuAction())
+        self.menubar.addAction(self.menuAbout.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Quick Move"))
+        self.payloadLabel.setText(_translate("MainWindow", "Moving (some number of) items to:"))
+        self.destinationEdit.setPlaceholderText(_translate("MainWindow", "Destination..."))
+        self.moveButton.setText(_translate("MainWindow", "Move"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.menuAbout.setTitle(_translate("MainWindow", "About"))
+        self.menuHistory.setTitle(_translate("MainWindow", "History"))
+        self.actionAbout_Quick_Move.setText(_translate("MainWindow", "About Quick Move"))
+        self.actionAbout_Quick_Move.setStatusTip(_translate("MainWindow", "Show program version number and license."))
+        self.actionAbout_Quick_Move.setShortcut(_translate("MainWindow", "F1"))
+        self.actionAbout_Qt.setText(_translate("MainWindow", "About Qt"))
+        self.actionAbout_Qt.setStatusTip(_translate("MainWindow", "Show Qt framework version and license."))
+        self.actionQuit.setText(_translate("MainWindow", "&Quit"))
+        self.actionQuit.setStatusTip(_translate("MainWindow", "Exit the application."))
+        self.actionQuit.setShortcut(_translate("MainWindow", "Ctrl+Q"))
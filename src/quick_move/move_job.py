@@ -0,0 +1,57 @@
+"""Moving files on a background thread, so the UI stays responsive."""
+
+import errno
+import os
+import shutil
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+def move_path(src: str, dst: str) -> None:
+    """Move `src` to exactly `dst`, which must not exist yet.
+
+    `shutil.move` also tries a rename first, but only after several other checks.
+    This goes straight to the rename, falling back to `shutil.move` across file systems.
+    """
+    # Don't overwrite anything. (os.rename would silently replace a file on POSIX.)
+    if os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, "Destination path already exists", dst)
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+class MoveJobSignals(QObject):
+    """Signals for a `MoveJob`. (QRunnable isn't a QObject, so it can't have signals itself.)"""
+
+    fileMoved = pyqtSignal(str, str, str)
+    """Emitted for each file, with the source path, destination directory, and an error message (empty if successful)."""
+
+    finished = pyqtSignal()
+    """Emitted after all files have been processed."""
+
+
+class MoveJob(QRunnable):
+    """Moves files to a destination directory, for use with a QThreadPool."""
+
+    def __init__(self, files: list[str], destination: str):
+        super().__init__()
+        self.files = files
+        self.destination = destination
+        self.signals = MoveJobSignals()
+
+    def run(self) -> None:
+        # TODO: Can we do this atomically?
+        # Or make this more flexible, like prompt to undo, retry, skip, or (if applicable) overwrite
+        # (Would be easier if we could reuse a file manager / OS dialog for this, either with an API or desktop automation.)
+        for file in self.files:
+            try:
+                move_path(file, os.path.join(self.destination, os.path.basename(file)))
+            except Exception as e:
+                self.signals.fileMoved.emit(file, self.destination, str(e))
+            else:
+                self.signals.fileMoved.emit(file, self.destination, "")
+        self.signals.finished.emit()
@@ -0,0 +1,48 @@
+# Form implementation generated from reading ui file 'recent_move_dialog.ui'
+#
+# Created by: PyQt6 UI code generator 6.9.1
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(400, 300)
+        self.buttonBox = QtWidgets.QDialogButtonBox(parent=Dialog)
+        self.buttonBox.setGeometry(QtCore.QRect(30, 240, 341, 32))
+        self.buttonBox.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Close)
+        self.buttonBox.setObjectName("buttonBox")
+        self.undoMoveButton = QtWidgets.QPushButton(parent=Dialog)
+        self.undoMoveButton.setGeometry(QtCore.QRect(30, 200, 151, 24))
+        self.undoMoveButton.setObjectName("undoMoveButton")
+        self.openDestinationButton = QtWidgets.QPushButton(parent=Dialog)
+        self.openDestinationButton.setGeometry(QtCore.QRect(200, 200, 171, 24))
+        self.openDestinationButton.setObjectName("openDestinationButton")
+        self.movedFilesLabel = QtWidgets.QLabel(parent=Dialog)
+        self.movedFilesLabel.setGeometry(QtCore.QRect(30, 20, 341, 16))
+        self.movedFilesLabel.setObjectName("movedFilesLabel")
+        self.destinationLabel = QtWidgets.QLabel(parent=Dialog)
+        self.destinationLabel.setGeometry(QtCore.QRect(30, 160, 341, 16))
+        self.destinationLabel.setObjectName("destinationLabel")
+        self.movedFilesTextBrowser = QtWidgets.QTextBrowser(parent=Dialog)
+        self.movedFilesTextBrowser.setGeometry(QtCore.QRect(30, 50, 341, 101))
+        self.movedFilesTextBrowser.setObjectName("movedFilesTextBrowser")
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.undoMoveButton.setText(_translate("Dialog", "Undo Move"))
+        self.openDestinationButton.setText(_translate("Dialog", "Open Destination Folder"))
+        self.movedFilesLabel.setText(_translate("Dialog", "Moved files:"))
+        self.destinationLabel.setText(_translate("Dialog", "Destination: (some destination)"))
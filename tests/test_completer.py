@@ -17,13 +17,14 @@
 # - Input is "tiam"
 #   - Should suggest Project Stuff/Tiamblia, keeping the input field relative to the destination scope of "/home/io/Sync/" (which will be changeable and persistent)
 
+import os
 from pathlib import Path
 
 import pytest
 from pyfakefs.fake_filesystem import FakeFilesystem, OSType
 from pyfakefs.fake_filesystem_unittest import Patcher
 
-from quick_move.completer import get_completions
+from quick_move.completer import ENOUGH_GOOD_COMPLETIONS, get_completions, invalidate_listing_cache
 from quick_move.helpers import tree
 from tests import accept
 
@@ -33,6 +34,8 @@ from tests import accept
 # This fixture sets up a fake filesystem for testing, excluding the "accept" module.
 @pytest.fixture
 def my_fs():
+    # Cached directory listings from other tests' file systems could otherwise match by timestamp.
+    invalidate_listing_cache()
     with Patcher(additional_skip_names=[accept]) as patcher:
         yield patcher.fs
 
@@ -185,10 +188,68 @@ def test_deprioritizing_extraneous_characters(my_fs_2: FakeFilesystem):
         "/home/io/Sync/alphabet/a",
     ])
 
+def test_hidden_and_package_folders_not_searched(my_fs: FakeFilesystem):
+    my_fs.os = OSType.LINUX
+    my_fs.create_dir("/home/io/Sync/.git/objects")  # pyright: ignore[reportUnknownMemberType]
+    my_fs.create_dir("/home/io/Sync/Project/node_modules/pkg")  # pyright: ignore[reportUnknownMemberType]
+    # Suggested, but not searched inside
+    expect_completions(my_fs, "/home/io/Sync/", [
+        "/home/io/Sync/Project",
+        "/home/io/Sync/Project/node_modules",
+        "/home/io/Sync/.git",
+    ])
+    # Searched inside if the search is already inside
+    expect_completions(my_fs, "/home/io/Sync/.git/", [
+        "/home/io/Sync/.git/objects",
+    ])
+    expect_completions(my_fs, "/home/io/Sync/Project/node_modules/", [
+        "/home/io/Sync/Project/node_modules/pkg",
+    ])
+
+def test_search_stops_after_enough_good_matches(my_fs: FakeFilesystem):
+    my_fs.os = OSType.LINUX
+    for i in range(ENOUGH_GOOD_COMPLETIONS):
+        my_fs.create_dir(f"/home/io/Sync/foo{i:02}/foo")  # pyright: ignore[reportUnknownMemberType]
+    # The subfolders would match too, but the top level already has enough full, in-order matches.
+    expect_completions(my_fs, "/home/io/Sync/foo", [
+        f"/home/io/Sync/foo{i:02}" for i in range(ENOUGH_GOOD_COMPLETIONS)
+    ])
+
+def test_listing_cache_refreshed_when_directory_changes(my_fs: FakeFilesystem):
+    my_fs.os = OSType.LINUX
+    my_fs.create_dir("/home/io/Sync/Alpha")  # pyright: ignore[reportUnknownMemberType]
+    expect_completions(my_fs, "/home/io/Sync/", ["/home/io/Sync/Alpha"])
+    # The listing is cached, but revalidated by the directory's modification time.
+    # (The time is set explicitly, since it might not change otherwise, if the file system's timestamps are coarse.)
+    my_fs.create_dir("/home/io/Sync/Beta")  # pyright: ignore[reportUnknownMemberType]
+    bump_mtime("/home/io/Sync")
+    expect_completions(my_fs, "/home/io/Sync/", ["/home/io/Sync/Alpha", "/home/io/Sync/Beta"])
+    os.rmdir("/home/io/Sync/Alpha")
+    bump_mtime("/home/io/Sync")
+    expect_completions(my_fs, "/home/io/Sync/", ["/home/io/Sync/Beta"])
+
+def test_listing_cache_invalidated_explicitly(my_fs: FakeFilesystem):
+    my_fs.os = OSType.LINUX
+    my_fs.create_dir("/home/io/Sync/Alpha")  # pyright: ignore[reportUnknownMemberType]
+    expect_completions(my_fs, "/home/io/Sync/", ["/home/io/Sync/Alpha"])
+    # Simulate a change that doesn't show in the modification time
+    stat_before = os.stat("/home/io/Sync")
+    my_fs.create_dir("/home/io/Sync/Beta")  # pyright: ignore[reportUnknownMemberType]
+    os.utime("/home/io/Sync", ns=(stat_before.st_atime_ns, stat_before.st_mtime_ns))
+    # Stale listing, since the directory looks unchanged
+    expect_completions(my_fs, "/home/io/Sync/", ["/home/io/Sync/Alpha"])
+    invalidate_listing_cache("/home/io/Sync/")
+    expect_completions(my_fs, "/home/io/Sync/", ["/home/io/Sync/Alpha", "/home/io/Sync/Beta"])
+
 @pytest.mark.xfail(reason="Currently gives absolute paths always")
 def test_relative_path_stays_relative(my_fs_1: FakeFilesystem):
     expect_completions(my_fs_1, "tiam", ["Project Stuff/Tiamblia"])
 
+def bump_mtime(path: str):
+    """Move a directory's modification time a second forward, as if it had been changed."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
 def expect_completions(my_fs: FakeFilesystem, input_path: str, expected: list[str]):
     completions = get_completions(input_path, "/home/io/Sync/")
     result = [completion.display_text for completion in completions]
@@ -0,0 +1,77 @@
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from quick_move.move_job import move_path
+
+
+def test_move_path_renames(tmp_path: Path):
+    src = tmp_path / "file.txt"
+    src.write_text("contents")
+    (tmp_path / "dest").mkdir()
+    dst = tmp_path / "dest" / "file.txt"
+    move_path(str(src), str(dst))
+    assert not src.exists()
+    assert dst.read_text() == "contents"
+
+def test_move_path_moves_directory(tmp_path: Path):
+    src = tmp_path / "folder"
+    src.mkdir()
+    (src / "inner.txt").write_text("inner")
+    dst = tmp_path / "renamed folder"
+    move_path(str(src), str(dst))
+    assert not src.exists()
+    assert (dst / "inner.txt").read_text() == "inner"
+
+def test_move_path_does_not_overwrite_file(tmp_path: Path):
+    src = tmp_path / "file.txt"
+    src.write_text("new")
+    dst = tmp_path / "existing.txt"
+    dst.write_text("old")
+    with pytest.raises(FileExistsError):
+        move_path(str(src), str(dst))
+    assert src.read_text() == "new"
+    assert dst.read_text() == "old"
+
+def test_move_path_does_not_overwrite_directory(tmp_path: Path):
+    src = tmp_path / "folder"
+    src.mkdir()
+    dst = tmp_path / "existing folder"
+    dst.mkdir()
+    (dst / "keep.txt").write_text("keep")
+    with pytest.raises(FileExistsError):
+        move_path(str(src), str(dst))
+    assert src.is_dir()
+    assert os.listdir(dst) == ["keep.txt"]
+
+def test_move_path_does_not_overwrite_broken_symlink(tmp_path: Path):
+    src = tmp_path / "file.txt"
+    src.write_text("new")
+    dst = tmp_path / "link"
+    dst.symlink_to(tmp_path / "nonexistent")
+    with pytest.raises(FileExistsError):
+        move_path(str(src), str(dst))
+    assert src.read_text() == "new"
+    assert dst.is_symlink()
+
+def test_move_path_falls_back_to_copying_across_file_systems(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    def rename_across_devices(src: str, dst: str):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+    # shutil.move also tries os.rename first, so it sees the same error, and copies instead.
+    monkeypatch.setattr(os, "rename", rename_across_devices)
+    src = tmp_path / "file.txt"
+    src.write_text("contents")
+    (tmp_path / "dest").mkdir()
+    dst = tmp_path / "dest" / "file.txt"
+    move_path(str(src), str(dst))
+    assert not src.exists()
+    assert dst.read_text() == "contents"
+
+def test_move_path_raises_other_errors(tmp_path: Path):
+    src = tmp_path / "nonexistent.txt"
+    dst = tmp_path / "file.txt"
+    with pytest.raises(FileNotFoundError):
+        move_path(str(src), str(dst))
+    assert not dst.exists()